@@ -0,0 +1,23 @@
+"""Optional build hook compiling the protocol decoders with mypyc.
+
+Package metadata lives in ``pyproject.toml``.  When ``NTA_USE_MYPYC=1`` is set
+at install time, ``protocols/bgp.py`` and ``protocols/ospf.py`` are compiled
+into C extensions with mypyc; otherwise the package installs as pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("NTA_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/network_traffic_analyzer/protocols/bgp.py",
+            "src/network_traffic_analyzer/protocols/ospf.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
@@ -7,6 +7,7 @@ from .protocols.ospf import parse_ospf_lsas, OspfRouterLsa
 from .topology import NetworkTopology
 from .metrics import TrafficMetrics
 from .dashboard import DashboardData
+from .parallel import analyze_capture
 
 __all__ = [
     "Packet",
@@ -19,4 +20,5 @@ __all__ = [
     "NetworkTopology",
     "TrafficMetrics",
     "DashboardData",
+    "analyze_capture",
 ]
@@ -3,12 +3,37 @@
 from __future__ import annotations
 
 import json
+import queue
 import subprocess
+import threading
+from binascii import unhexlify
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+from typing import IO, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .packets import Packet
 
+try:  # Optional accelerator; the standard library decoder is used otherwise.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Captures are read in large binary blocks and split into records in C rather
+# than iterating the file object line by line.
+_READ_CHUNK_SIZE = 1 << 20
+
+# Simulator output is handed from the reader thread in raw blocks; the queue
+# bound caps how far the reader may run ahead of the decoder.
+_PIPE_READ_SIZE = 1 << 16
+_PIPE_QUEUE_SIZE = 64
+
+_METADATA_PREFIX = "meta_"
+_METADATA_MARKER = _METADATA_PREFIX.encode("ascii")
+
+# Payload protocols understood by :class:`~network_traffic_analyzer.topology.NetworkTopology`.
+_DECODED_PROTOCOLS = frozenset({"BGP", "OSPF"})
+
 
 class PacketSource(Iterable[Packet]):
     """Abstract iterable that yields :class:`~network_traffic_analyzer.packets.Packet`."""
@@ -36,32 +61,56 @@ class JSONPacketSource(PacketSource):
         Hex encoded payload for protocol decoding.
     Optional keys ``latency_ms`` and ``throughput_mbps`` provide metrics used by
     the dashboard.
+
+    Records are decoded with :mod:`orjson` when it is installed and with the
+    standard :mod:`json` module otherwise.  ``start`` and ``end`` restrict the
+    source to a byte range of the file, which must begin and end on line
+    boundaries (see :func:`split_capture`).
+
+    Only BGP and OSPF payloads are hex-decoded by default since no other
+    payload is inspected by the analyzer; other packets get an empty
+    ``payload``.  Pass ``decode_payload=True`` to decode every payload.
     """
 
-    def __init__(self, path: Path | str) -> None:
+    def __init__(
+        self,
+        path: Path | str,
+        chunk_size: int = _READ_CHUNK_SIZE,
+        start: int = 0,
+        end: Optional[int] = None,
+        decode_payload: bool = False,
+    ) -> None:
         self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.start = start
+        self.end = end
+        self.decode_payload = decode_payload
 
     def __iter__(self) -> Iterator[Packet]:
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                if not line.strip():
-                    continue
-                record = json.loads(line)
-                yield _record_to_packet(record)
+        with self.path.open("rb") as handle:
+            handle.seek(self.start)
+            limit = None if self.end is None else self.end - self.start
+            for line in _iter_lines(handle, self.chunk_size, limit):
+                yield _record_to_packet(_loads(line), _METADATA_MARKER in line, self.decode_payload)
 
 
 class SimulatorPacketSource(PacketSource):
-    """Invoke the bundled C simulator to produce synthetic traffic."""
+    """Invoke the bundled C simulator to produce synthetic traffic.
+
+    ``decode_payload`` behaves as for :class:`JSONPacketSource`.
+    """
 
     def __init__(
         self,
         executable: Path | str,
         count: int = 256,
         seed: Optional[int] = None,
+        decode_payload: bool = False,
     ) -> None:
         self.executable = Path(executable)
         self.count = count
         self.seed = seed
+        self.decode_payload = decode_payload
 
     def __iter__(self) -> Iterator[Packet]:
         if not self.executable.exists():
@@ -73,21 +122,36 @@ class SimulatorPacketSource(PacketSource):
         if self.seed is not None:
             command.append(str(self.seed))
 
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-        )
-        assert process.stdout is not None
-        for line in process.stdout:
-            if not line.strip():
-                continue
-            record = json.loads(line)
-            yield _record_to_packet(record)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        assert process.stdout is not None and process.stderr is not None
+        # A reader thread drains the pipe in raw blocks while this thread
+        # decodes records.  The reader spends nearly all of its time in
+        # blocking reads, which release the GIL, so the two overlap.
+        chunks: "queue.Queue[bytes | BaseException | None]" = queue.Queue(maxsize=_PIPE_QUEUE_SIZE)
+        reader = threading.Thread(target=_pump_chunks, args=(process.stdout, chunks), daemon=True)
+        reader.start()
+        finished = False
+        try:
+            for line in _split_lines(_drain(chunks)):
+                yield _record_to_packet(_loads(line), _METADATA_MARKER in line, self.decode_payload)
+            finished = True
+        finally:
+            if not finished:
+                # The consumer stopped early: stop the simulator, unblock the
+                # reader and reap the process before the exception propagates.
+                process.kill()
+                while reader.is_alive():
+                    try:
+                        chunks.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                process.stdout.close()
+                process.stderr.close()
+                process.wait()
+        reader.join()
         process.stdout.close()
-        stderr_output = process.stderr.read()
+        stderr_output = process.stderr.read().decode("utf-8", "replace")
+        process.stderr.close()
         return_code = process.wait()
         if return_code != 0:
             raise RuntimeError(
@@ -95,18 +159,118 @@ class SimulatorPacketSource(PacketSource):
             )
 
 
-def _record_to_packet(record: dict) -> Packet:
-    payload_hex = record.get("payload_hex", "")
-    payload = bytes.fromhex(payload_hex)
+def _pump_chunks(stream: IO[bytes], chunks: "queue.Queue[bytes | BaseException | None]") -> None:
+    """Forward raw blocks from ``stream`` to ``chunks``; ``None`` marks EOF."""
+
+    try:
+        while True:
+            chunk = stream.read1(_PIPE_READ_SIZE)  # type: ignore[attr-defined]
+            if not chunk:
+                break
+            chunks.put(chunk)
+    except BaseException as exc:  # pragma: no cover - surfaced in the consumer
+        chunks.put(exc)
+        return
+    chunks.put(None)
+
+
+def _drain(chunks: "queue.Queue[bytes | BaseException | None]") -> Iterator[bytes]:
+    while True:
+        chunk = chunks.get()
+        if chunk is None:
+            return
+        if isinstance(chunk, BaseException):
+            raise chunk
+        yield chunk
+
+
+def split_capture(path: Path | str, parts: int) -> List[Tuple[int, int]]:
+    """Split a JSON capture into at most ``parts`` line-aligned byte ranges."""
+
+    path = Path(path)
+    size = path.stat().st_size
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    with path.open("rb") as handle:
+        for index in range(1, parts):
+            if start >= size:
+                break
+            handle.seek(max(start, size * index // parts))
+            handle.readline()
+            end = handle.tell()
+            if end > start:
+                ranges.append((start, end))
+                start = end
+    if start < size or not ranges:
+        ranges.append((start, size))
+    return ranges
+
+
+def _iter_lines(handle: BinaryIO, chunk_size: int, limit: Optional[int] = None) -> Iterator[bytes]:
+    """Yield the non-blank lines of ``handle`` reading ``chunk_size`` bytes at a time.
+
+    When ``limit`` is given at most that many bytes are consumed.
+    """
+
+    return _split_lines(_read_chunks(handle, chunk_size, limit))
+
+
+def _read_chunks(handle: BinaryIO, chunk_size: int, limit: Optional[int]) -> Iterator[bytes]:
+    while limit is None or limit > 0:
+        chunk = handle.read(chunk_size if limit is None else min(chunk_size, limit))
+        if not chunk:
+            break
+        if limit is not None:
+            limit -= len(chunk)
+        yield chunk
+
+
+def _split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Reassemble the non-blank lines spread over a sequence of byte blocks."""
+
+    remainder = b""
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+    if remainder.strip():
+        yield remainder
+
+
+def _record_to_packet(record: dict, has_metadata: bool = True, decode_payload: bool = True) -> Packet:
+    """Build a :class:`Packet` from a decoded capture record.
+
+    ``has_metadata`` lets callers skip the ``meta_*`` key scan when a cheap
+    check on the raw line already ruled it out.  Unless ``decode_payload`` is
+    set, only payloads of protocols the analyzer decodes are hex-decoded.
+    """
+
+    get = record.get
+    payload_protocol = get("payload_protocol")
+    payload_hex = get("payload_hex", "")
+    if decode_payload or payload_protocol in _DECODED_PROTOCOLS:
+        payload = unhexlify(payload_hex)
+    else:
+        payload = b""
+    length = get("length")
+    latency = get("latency_ms")
+    throughput = get("throughput_mbps")
     return Packet(
         timestamp=float(record["timestamp"]),
         src_ip=record["src_ip"],
         dst_ip=record["dst_ip"],
-        transport_protocol=record.get("transport_protocol", record.get("protocol", "TCP")),
-        payload_protocol=record.get("payload_protocol"),
-        length=int(record.get("length", len(payload))),
+        transport_protocol=get("transport_protocol", get("protocol", "TCP")),
+        payload_protocol=payload_protocol,
+        length=int(length) if length is not None else len(payload_hex) // 2,
         payload=payload,
-        latency_ms=float(record["latency_ms"]) if "latency_ms" in record else None,
-        throughput_mbps=float(record["throughput_mbps"]) if "throughput_mbps" in record else None,
-        metadata={key: value for key, value in record.items() if key.startswith("meta_")},
+        latency_ms=float(latency) if latency is not None else None,
+        throughput_mbps=float(throughput) if throughput is not None else None,
+        metadata=_extract_metadata(record) if has_metadata else None,
     )
+
+
+def _extract_metadata(record: dict) -> Optional[Dict[str, object]]:
+    metadata = {key: value for key, value in record.items() if key.startswith(_METADATA_PREFIX)}
+    return metadata or None
@@ -3,20 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
 
-from .capture import JSONPacketSource, SimulatorPacketSource
+from .capture import JSONPacketSource, PacketSource, SimulatorPacketSource
 from .dashboard import DashboardData
 from .metrics import TrafficMetrics
-from .packets import Packet
+from .parallel import analyze_capture
 from .topology import NetworkTopology
 
 
-def _load_packets(source: Iterable[Packet]) -> List[Packet]:
-    return list(source)
-
-
 def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Network traffic analyzer")
     group = parser.add_mutually_exclusive_group(required=True)
@@ -28,21 +25,42 @@ def main(argv: List[str] | None = None) -> int:
     )
     parser.add_argument("--count", type=int, default=256, help="Number of packets to request from the simulator")
     parser.add_argument("--seed", type=int, default=None, help="Seed for the simulator")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to analyze an --input capture",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Decode every BGP/OSPF payload instead of reusing results for repeated payloads",
+    )
     args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not args.input:
+        parser.error("--workers requires --input")
 
-    if args.input:
-        packets = _load_packets(JSONPacketSource(args.input))
+    if args.workers > 1:
+        topology, metrics = analyze_capture(args.input, workers=args.workers, cache_parses=not args.no_cache)
     else:
-        packets = _load_packets(SimulatorPacketSource(args.simulate, count=args.count, seed=args.seed))
+        source: PacketSource
+        if args.input:
+            source = JSONPacketSource(args.input)
+        else:
+            source = SimulatorPacketSource(args.simulate, count=args.count, seed=args.seed)
 
-    topology = NetworkTopology()
-    metrics = TrafficMetrics()
-    for packet in packets:
-        topology.ingest_packet(packet)
-        metrics.record_packet(packet)
+        # Packets are analyzed as they are read so the capture is never held
+        # in memory as a whole.
+        topology = NetworkTopology(cache_parses=not args.no_cache)
+        metrics = TrafficMetrics()
+        for packet in source:
+            topology.ingest_packet(packet)
+            metrics.record_packet(packet)
 
     dashboard = DashboardData(metrics=metrics, topology=topology)
-    print(dashboard.to_markdown())
+    dashboard.write_markdown(sys.stdout)
     return 0
 
 
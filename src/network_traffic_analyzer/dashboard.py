@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import io
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
-from .metrics import TrafficMetrics
+from .metrics import Link, TrafficMetrics
 from .topology import NetworkTopology
 
 
@@ -15,59 +16,66 @@ class DashboardData:
     topology: NetworkTopology
 
     def summary(self) -> Dict[str, object]:
-        avg_latency = {
-            f"{src}->{dst}": value for (src, dst), value in self.metrics.average_latency().items()
-        }
-        avg_throughput = {
-            f"{src}->{dst}": value for (src, dst), value in self.metrics.average_throughput().items()
-        }
-        bottlenecks = [
-            {
-                "link": f"{src}->{dst}",
-                "latency_ms": entry.get("latency_ms"),
-                "throughput_mbps": entry.get("throughput_mbps"),
-            }
-            for entry in self.metrics.detect_bottlenecks()
-            for src, dst in [entry["link"]]
-        ]
         return {
             "nodes": sorted(self.topology.nodes),
             "links": {
-                f"{src}->{dst}": {
-                    "metric": metadata.metric,
-                    "protocols": sorted(metadata.protocols),
-                }
-                for (src, dst), metadata in self.topology.links.items()
+                link: {"metric": metric, "protocols": protocols}
+                for link, metric, protocols in self._iter_links()
             },
-            "average_latency_ms": avg_latency,
-            "average_throughput_mbps": avg_throughput,
-            "bottlenecks": bottlenecks,
+            "average_latency_ms": dict(_iter_named(self.metrics.average_latency())),
+            "average_throughput_mbps": dict(_iter_named(self.metrics.average_throughput())),
+            "bottlenecks": [
+                {"link": link, "latency_ms": latency, "throughput_mbps": throughput}
+                for link, latency, throughput in self._iter_bottlenecks()
+            ],
         }
 
     def to_markdown(self) -> str:
-        summary = self.summary()
-        lines: List[str] = ["# Network Traffic Dashboard", "", "## Nodes", ", ".join(summary["nodes"]) or "None"]
-        lines.append("\n## Links")
-        for link, metadata in summary["links"].items():
-            lines.append(
-                f"- **{link}**: metric={metadata['metric']}, protocols={', '.join(metadata['protocols'])}"
+        buffer = io.StringIO()
+        self.write_markdown(buffer)
+        return buffer.getvalue()[:-1]
+
+    def write_markdown(self, out: TextIO) -> None:
+        """Write the Markdown dashboard to ``out`` one line at a time.
+
+        Sections are formatted straight from the topology and metrics without
+        building the intermediate :meth:`summary` dictionary.
+        """
+
+        write = out.write
+        write("# Network Traffic Dashboard\n\n## Nodes\n")
+        write((", ".join(sorted(self.topology.nodes)) or "None") + "\n")
+        write("\n## Links\n")
+        for link, metric, protocols in self._iter_links():
+            write(f"- **{link}**: metric={metric}, protocols={', '.join(protocols)}\n")
+        write("\n## Average Latency (ms)\n")
+        for link, value in _iter_named(self.metrics.average_latency()):
+            write(f"- {link}: {value:.2f}\n")
+        write("\n## Average Throughput (Mbps)\n")
+        for link, value in _iter_named(self.metrics.average_throughput()):
+            write(f"- {link}: {value:.2f}\n")
+        write("\n## Potential Bottlenecks\n")
+        detected = False
+        for link, latency, throughput in self._iter_bottlenecks():
+            detected = True
+            write(
+                f"- {link}: latency={latency:.2f} ms, throughput={throughput:.2f} Mbps\n"
+                if latency is not None and throughput is not None
+                else f"- {link}: latency={latency}, throughput={throughput}\n"
             )
-        lines.append("\n## Average Latency (ms)")
-        for link, value in summary["average_latency_ms"].items():
-            lines.append(f"- {link}: {value:.2f}")
-        lines.append("\n## Average Throughput (Mbps)")
-        for link, value in summary["average_throughput_mbps"].items():
-            lines.append(f"- {link}: {value:.2f}")
-        lines.append("\n## Potential Bottlenecks")
-        if not summary["bottlenecks"]:
-            lines.append("- None detected")
-        else:
-            for entry in summary["bottlenecks"]:
-                latency = entry.get("latency_ms")
-                throughput = entry.get("throughput_mbps")
-                lines.append(
-                    f"- {entry['link']}: latency={latency:.2f} ms, throughput={throughput:.2f} Mbps"
-                    if latency is not None and throughput is not None
-                    else f"- {entry['link']}: latency={latency}, throughput={throughput}"
-                )
-        return "\n".join(lines)
+        if not detected:
+            write("- None detected\n")
+
+    def _iter_links(self) -> Iterator[Tuple[str, float, List[str]]]:
+        for (src, dst), metadata in self.topology.links.items():
+            yield f"{src}->{dst}", metadata.metric, sorted(metadata.protocols)
+
+    def _iter_bottlenecks(self) -> Iterator[Tuple[str, Optional[float], Optional[float]]]:
+        for entry in self.metrics.detect_bottlenecks():
+            src, dst = entry["link"]
+            yield f"{src}->{dst}", entry.get("latency_ms"), entry.get("throughput_mbps")
+
+
+def _iter_named(values: Dict[Link, float]) -> Iterator[Tuple[str, float]]:
+    for (src, dst), value in values.items():
+        yield f"{src}->{dst}", value
@@ -2,39 +2,127 @@
 
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
-from dataclasses import dataclass, field
-from statistics import mean
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .packets import Packet, sliding_window
 
 Link = Tuple[str, str]
 
 
-@dataclass
 class TrafficMetrics:
-    """Aggregate latency and throughput measurements by link."""
+    """Aggregate latency and throughput measurements by link.
 
-    latency_samples: Dict[Link, List[float]] = field(default_factory=lambda: defaultdict(list))
-    throughput_samples: Dict[Link, List[float]] = field(default_factory=lambda: defaultdict(list))
+    Only a running count and sum are kept for each link and metric, so memory
+    grows with the number of links rather than the number of packets.  Pass
+    ``keep_samples=True`` to also retain every individual sample, stored
+    column-wise as an ``array("d")`` of values next to an ``array("I")`` holding
+    the index of the link each value belongs to.
+    """
+
+    def __init__(self, *, keep_samples: bool = False) -> None:
+        self.keep_samples = keep_samples
+        # Link indices are looked up per source then per destination address,
+        # which avoids allocating and hashing a tuple for every sample.
+        self._link_ids: Dict[str, Dict[str, int]] = {}
+        self._links: List[Link] = []
+        self._latency_counts = array("L")
+        self._latency_sums = array("d")
+        self._throughput_counts = array("L")
+        self._throughput_sums = array("d")
+        self._latency_values = array("d")
+        self._latency_links = array("I")
+        self._throughput_values = array("d")
+        self._throughput_links = array("I")
+
+    @property
+    def latency_samples(self) -> Dict[Link, List[float]]:
+        return self._group(self._latency_values, self._latency_links)
+
+    @property
+    def throughput_samples(self) -> Dict[Link, List[float]]:
+        return self._group(self._throughput_values, self._throughput_links)
 
     def record_packet(self, packet: Packet) -> None:
-        link = (packet.src_ip, packet.dst_ip)
-        if packet.latency_ms is not None:
-            self.latency_samples[link].append(packet.latency_ms)
-        if packet.throughput_mbps is not None:
-            self.throughput_samples[link].append(packet.throughput_mbps)
+        latency = packet.latency_ms
+        throughput = packet.throughput_mbps
+        if latency is None and throughput is None:
+            return
+        link_id = self._link_id(packet.src_ip, packet.dst_ip)
+        if latency is not None:
+            self._latency_counts[link_id] += 1
+            self._latency_sums[link_id] += latency
+        if throughput is not None:
+            self._throughput_counts[link_id] += 1
+            self._throughput_sums[link_id] += throughput
+        if self.keep_samples:
+            if latency is not None:
+                self._latency_values.append(latency)
+                self._latency_links.append(link_id)
+            if throughput is not None:
+                self._throughput_values.append(throughput)
+                self._throughput_links.append(link_id)
 
     def extend(self, packets: Iterable[Packet]) -> None:
         for packet in packets:
             self.record_packet(packet)
 
+    def merge(self, other: "TrafficMetrics") -> None:
+        """Add the measurements recorded by ``other`` to this instance.
+
+        Samples are only carried over when both instances keep them.
+        """
+
+        link_ids = [self._link_id(src, dst) for src, dst in other._links]
+        for other_id, link_id in enumerate(link_ids):
+            self._latency_counts[link_id] += other._latency_counts[other_id]
+            self._latency_sums[link_id] += other._latency_sums[other_id]
+            self._throughput_counts[link_id] += other._throughput_counts[other_id]
+            self._throughput_sums[link_id] += other._throughput_sums[other_id]
+        if self.keep_samples and other.keep_samples:
+            self._latency_values.extend(other._latency_values)
+            self._latency_links.extend(array("I", (link_ids[link_id] for link_id in other._latency_links)))
+            self._throughput_values.extend(other._throughput_values)
+            self._throughput_links.extend(array("I", (link_ids[link_id] for link_id in other._throughput_links)))
+
     def average_latency(self) -> Dict[Link, float]:
-        return {link: mean(values) for link, values in self.latency_samples.items() if values}
+        return self._averages(self._latency_counts, self._latency_sums)
 
     def average_throughput(self) -> Dict[Link, float]:
-        return {link: mean(values) for link, values in self.throughput_samples.items() if values}
+        return self._averages(self._throughput_counts, self._throughput_sums)
+
+    def _link_id(self, src: str, dst: str) -> int:
+        by_dst = self._link_ids.get(src)
+        if by_dst is None:
+            by_dst = self._link_ids[src] = {}
+        link_id = by_dst.get(dst)
+        if link_id is None:
+            link_id = by_dst[dst] = len(self._links)
+            self._links.append((src, dst))
+            self._latency_counts.append(0)
+            self._latency_sums.append(0.0)
+            self._throughput_counts.append(0)
+            self._throughput_sums.append(0.0)
+        return link_id
+
+    def _group(self, values: array, links: array) -> Dict[Link, List[float]]:
+        if not self.keep_samples:
+            raise ValueError("Samples are only retained when created with keep_samples=True")
+        grouped: Dict[Link, List[float]] = {}
+        for link_id, value in zip(links, values):
+            grouped.setdefault(self._links[link_id], []).append(value)
+        return grouped
+
+    @staticmethod
+    def _means(counts: array, sums: array) -> List[Optional[float]]:
+        """Return the mean for every link index, ``None`` when it has no samples."""
+
+        return [total / count if count else None for count, total in zip(counts, sums)]
+
+    def _averages(self, counts: array, sums: array) -> Dict[Link, float]:
+        means = self._means(counts, sums)
+        return {link: mean for link, mean in zip(self._links, means) if mean is not None}
 
     def detect_bottlenecks(
         self,
@@ -44,11 +132,9 @@ class TrafficMetrics:
         """Identify links that exceed latency or fall below throughput thresholds."""
 
         bottlenecks: List[dict] = []
-        avg_latency = self.average_latency()
-        avg_throughput = self.average_throughput()
-        for link in set(avg_latency) | set(avg_throughput):
-            latency = avg_latency.get(link)
-            throughput = avg_throughput.get(link)
+        latencies = self._means(self._latency_counts, self._latency_sums)
+        throughputs = self._means(self._throughput_counts, self._throughput_sums)
+        for link, latency, throughput in zip(self._links, latencies, throughputs):
             if (latency is not None and latency > latency_threshold) or (
                 throughput is not None and throughput < throughput_threshold
             ):
@@ -61,18 +147,24 @@ class TrafficMetrics:
                 )
         return bottlenecks
 
-    def rolling_throughput(self, packets: Iterable[Packet], window: float = 1.0) -> Dict[Link, float]:
-        """Compute rolling throughput per link within the provided window."""
+    def rolling_throughput(
+        self, packets: Iterable[Packet], window: float = 1.0
+    ) -> Dict[float, Dict[Link, float]]:
+        """Compute rolling throughput per link within the provided window.
+
+        The result maps the timestamp closing each window to the average
+        throughput of every link that has samples inside that window.
+        """
 
-        totals: Dict[Link, float] = defaultdict(float)
-        counts: Dict[Link, int] = defaultdict(int)
+        rolling: Dict[float, Dict[Link, float]] = {}
         for bucket in sliding_window(packets, window):
-            totals.clear()
-            counts.clear()
+            totals: Dict[Link, float] = defaultdict(float)
+            counts: Dict[Link, int] = defaultdict(int)
             for packet in bucket:
                 if packet.throughput_mbps is None:
                     continue
                 link = (packet.src_ip, packet.dst_ip)
                 totals[link] += packet.throughput_mbps
                 counts[link] += 1
-        return {link: totals[link] / counts[link] for link in totals if counts[link]}
+            rolling[bucket[-1].timestamp] = {link: totals[link] / counts[link] for link in totals}
+        return rolling
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, Iterator, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional
 
 
 @dataclass(slots=True)
@@ -12,6 +13,8 @@ class Packet:
 
     The analyzer focuses on metadata that is typically useful for traffic
     engineering: timestamps, addresses, payload length and auxiliary metrics.
+    ``metadata`` holds extra ``meta_*`` capture fields and is ``None`` for the
+    common case of packets without any, saving an empty dict per packet.
     """
 
     timestamp: float
@@ -23,12 +26,12 @@ class Packet:
     payload: bytes
     latency_ms: Optional[float] = None
     throughput_mbps: Optional[float] = None
-    metadata: Dict[str, object] = field(default_factory=dict)
+    metadata: Optional[Dict[str, object]] = None
 
     def copy_with(self, **updates: object) -> "Packet":
         """Return a copy of the packet with a subset of fields updated."""
 
-        data = {
+        data: Dict[str, Any] = {
             "timestamp": self.timestamp,
             "src_ip": self.src_ip,
             "dst_ip": self.dst_ip,
@@ -38,24 +41,29 @@ class Packet:
             "payload": self.payload,
             "latency_ms": self.latency_ms,
             "throughput_mbps": self.throughput_mbps,
-            "metadata": dict(self.metadata),
+            "metadata": dict(self.metadata) if self.metadata is not None else None,
         }
         data.update(updates)
         return Packet(**data)
 
 
-def sliding_window(packets: Iterable[Packet], window: float) -> Iterator[list[Packet]]:
+def sliding_window(packets: Iterable[Packet], window: float) -> Iterator[Deque[Packet]]:
     """Yield packets grouped in sliding time windows.
 
     The function keeps a rolling buffer of packets whose timestamp falls within
     ``window`` seconds of the most recent packet. It is primarily used for
     throughput calculations.
+
+    Packets are expected in timestamp order.  The same buffer is yielded on
+    every step and updated in place, so callers that need to keep a window must
+    copy it before advancing the iterator.
     """
 
-    bucket: list[Packet] = []
+    bucket: Deque[Packet] = deque()
     for packet in packets:
         bucket.append(packet)
         # Discard entries outside of the window interval.
         threshold = packet.timestamp - window
-        bucket = [item for item in bucket if item.timestamp >= threshold]
+        while bucket and bucket[0].timestamp < threshold:
+            bucket.popleft()
         yield bucket
@@ -0,0 +1,56 @@
+"""Analyze large JSON captures across several worker processes.
+
+Decoding BGP/OSPF payloads is pure Python, so threads cannot run it
+concurrently under the GIL.  Instead the capture is split into line-aligned
+byte ranges, each range is analyzed in its own process, and the partial
+topologies and metrics are merged back in capture order.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .capture import JSONPacketSource, split_capture
+from .metrics import TrafficMetrics
+from .topology import NetworkTopology
+
+
+def analyze_capture(
+    path: Path | str, workers: Optional[int] = None, *, cache_parses: bool = True
+) -> Tuple[NetworkTopology, TrafficMetrics]:
+    """Build the topology and metrics for a capture using ``workers`` processes.
+
+    ``workers`` defaults to the number of CPUs.  The result is the same as
+    ingesting every packet of the capture sequentially.  ``cache_parses`` is
+    forwarded to each worker's :class:`NetworkTopology`.
+    """
+
+    ranges = split_capture(path, workers or os.cpu_count() or 1)
+    if len(ranges) == 1:
+        return _analyze_range(path, *ranges[0], cache_parses)
+
+    topology = NetworkTopology(cache_parses=cache_parses)
+    metrics = TrafficMetrics()
+    paths = [path] * len(ranges)
+    starts = [start for start, _end in ranges]
+    ends = [end for _start, end in ranges]
+    caching = [cache_parses] * len(ranges)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        for part_topology, part_metrics in executor.map(_analyze_range, paths, starts, ends, caching):
+            topology.merge(part_topology)
+            metrics.merge(part_metrics)
+    return topology, metrics
+
+
+def _analyze_range(
+    path: Path | str, start: int, end: int, cache_parses: bool
+) -> Tuple[NetworkTopology, TrafficMetrics]:
+    topology = NetworkTopology(cache_parses=cache_parses)
+    metrics = TrafficMetrics()
+    for packet in JSONPacketSource(path, start=start, end=end):
+        topology.ingest_packet(packet)
+        metrics.record_packet(packet)
+    return topology, metrics
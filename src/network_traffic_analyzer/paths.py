@@ -0,0 +1,129 @@
+"""Shortest-path kernels over compressed sparse row (CSR) graphs.
+
+Nodes are integer ids.  The outgoing edges of node ``u`` are
+``neighbors[offsets[u]:offsets[u + 1]]`` with costs in the matching slice of
+``weights``.  The kernels only touch these integer/float sequences and never
+the topology objects, so they can be exercised and tuned in isolation.
+
+:func:`dial` is a bucket-queue variant of :func:`dijkstra` for graphs whose
+weights are small positive integers, such as OSPF interface costs.  Use
+:func:`dial_width` to decide whether it applies.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import List, Optional, Sequence
+
+# Upper bound on ``max weight * node count`` for which :func:`dial` is used;
+# it caps how many empty buckets a single query may have to scan.
+_DIAL_MAX_SPAN = 1 << 20
+
+
+def dijkstra(
+    offsets: Sequence[int],
+    neighbors: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+    target: int,
+) -> Optional[List[int]]:
+    """Return the node ids of a cheapest path from ``source`` to ``target``.
+
+    ``None`` is returned when ``target`` is unreachable.
+    """
+
+    node_count = len(offsets) - 1
+    costs = [math.inf] * node_count
+    predecessors = [-1] * node_count
+    costs[source] = 0.0
+    queue: List[tuple[float, int]] = [(0.0, source)]
+    while queue:
+        cost, node = heapq.heappop(queue)
+        if node == target:
+            return _walk_predecessors(predecessors, target)
+        if cost > costs[node]:
+            continue
+        for index in range(offsets[node], offsets[node + 1]):
+            neighbour = neighbors[index]
+            new_cost = cost + weights[index]
+            if new_cost < costs[neighbour]:
+                costs[neighbour] = new_cost
+                predecessors[neighbour] = node
+                heapq.heappush(queue, (new_cost, neighbour))
+    return None
+
+
+def dial_width(weights: Sequence[float], node_count: int) -> Optional[int]:
+    """Return the largest weight if every weight suits :func:`dial`, else ``None``.
+
+    Weights must be integers of at least 1 and the worst-case path cost must
+    stay within ``_DIAL_MAX_SPAN``.
+    """
+
+    if not weights:
+        return None
+    largest = max(weights)
+    if min(weights) < 1 or largest * node_count > _DIAL_MAX_SPAN:
+        return None
+    if not all(float(weight).is_integer() for weight in weights):
+        return None
+    return int(largest)
+
+
+def dial(
+    offsets: Sequence[int],
+    neighbors: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+    target: int,
+    max_weight: int,
+) -> Optional[List[int]]:
+    """Same contract as :func:`dijkstra` for integer weights in ``[1, max_weight]``.
+
+    Nodes are kept in a circular array of ``max_weight + 1`` buckets indexed by
+    cost.  Every edge costs at least 1, so a bucket is final once it is
+    reached; its nodes are settled in id order, which picks the same path as
+    the heap-based kernel when several paths tie.
+    """
+
+    node_count = len(offsets) - 1
+    width = max_weight + 1
+    buckets: List[List[int]] = [[] for _ in range(width)]
+    costs = [math.inf] * node_count
+    predecessors = [-1] * node_count
+    costs[source] = 0.0
+    buckets[0].append(source)
+    pending = 1
+    cost = 0
+    while pending:
+        bucket = buckets[cost % width]
+        if bucket:
+            pending -= len(bucket)
+            nodes = sorted(set(bucket))
+            bucket.clear()
+            for node in nodes:
+                if costs[node] != cost:
+                    continue
+                if node == target:
+                    return _walk_predecessors(predecessors, target)
+                for index in range(offsets[node], offsets[node + 1]):
+                    neighbour = neighbors[index]
+                    new_cost = cost + weights[index]
+                    if new_cost < costs[neighbour]:
+                        costs[neighbour] = new_cost
+                        predecessors[neighbour] = node
+                        buckets[int(new_cost) % width].append(neighbour)
+                        pending += 1
+        cost += 1
+    return None
+
+
+def _walk_predecessors(predecessors: List[int], target: int) -> List[int]:
+    path: List[int] = []
+    node = target
+    while node != -1:
+        path.append(node)
+        node = predecessors[node]
+    path.reverse()
+    return path
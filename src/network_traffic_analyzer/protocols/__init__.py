@@ -0,0 +1 @@
+"""Decoders for the routing protocols carried in captured packets."""
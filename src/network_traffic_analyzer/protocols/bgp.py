@@ -2,10 +2,28 @@
 
 from __future__ import annotations
 
-import ipaddress
 import struct
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from array import array
+from dataclasses import dataclass, field
+from socket import inet_ntoa
+from typing import Any, Dict, List, Optional, Union, cast
+
+_ATTRIBUTE_NAMES = {
+    1: "ORIGIN",
+    2: "AS_PATH",
+    3: "NEXT_HOP",
+    4: "MULTI_EXIT_DISC",
+}
+
+_ORIGIN_NAMES = {0: "IGP", 1: "EGP", 2: "INCOMPLETE"}
+
+_MARKER = b"\xff" * 16
+_LENGTH_AND_TYPE = struct.Struct("!HB")
+_U16 = struct.Struct("!H")
+_U32 = struct.Struct("!I")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+_EMPTY_ADDRESS = bytes(4)
 
 
 @dataclass(slots=True)
@@ -14,18 +32,12 @@ class BgpPathAttribute:
 
     flags: int
     type_code: int
-    value: object
+    value: Any
     raw_value: bytes
 
     @property
     def name(self) -> str:
-        mapping = {
-            1: "ORIGIN",
-            2: "AS_PATH",
-            3: "NEXT_HOP",
-            4: "MULTI_EXIT_DISC",
-        }
-        return mapping.get(self.type_code, f"ATTR_{self.type_code}")
+        return _ATTRIBUTE_NAMES.get(self.type_code, f"ATTR_{self.type_code}")
 
 
 @dataclass(slots=True)
@@ -35,85 +47,101 @@ class BgpUpdate:
     withdrawn_routes: List[str]
     path_attributes: List[BgpPathAttribute]
     nlri: List[str]
+    _by_type: Dict[int, BgpPathAttribute] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Index attributes once; the first occurrence of a type code wins.
+        self._by_type = {attribute.type_code: attribute for attribute in reversed(self.path_attributes)}
 
     def get_attribute(self, type_code: int) -> Optional[BgpPathAttribute]:
-        for attribute in self.path_attributes:
-            if attribute.type_code == type_code:
-                return attribute
-        return None
+        return self._by_type.get(type_code)
 
     @property
     def next_hop(self) -> Optional[str]:
         attribute = self.get_attribute(3)
-        return attribute.value if attribute else None
+        return cast(str, attribute.value) if attribute else None
 
     @property
     def as_path(self) -> List[int]:
         attribute = self.get_attribute(2)
-        return attribute.value if attribute else []
+        return list(attribute.value) if attribute else []
 
 
 class BgpParserError(ValueError):
     """Raised when the payload cannot be decoded as a BGP UPDATE."""
 
 
-def parse_bgp_update(payload: bytes) -> BgpUpdate:
+def parse_bgp_update(payload: Union[bytes, bytearray, memoryview]) -> BgpUpdate:
     """Parse a BGP UPDATE message.
 
     The simulator only produces IPv4 UPDATEs and therefore the parser focuses on
     a reduced portion of the RFC 4271 specification.  The implementation is kept
     deliberately small but is capable of handling real traffic captures with the
     same constraints.
+
+    ``payload`` may be any bytes-like object; it is sliced through a
+    :class:`memoryview` so the message is never copied while decoding.
     """
 
-    if len(payload) < 23:
+    data = memoryview(payload)
+    if len(data) < 23:
         raise BgpParserError("Payload too small for BGP header")
 
-    marker = payload[:16]
-    if marker != b"\xff" * 16:
+    if data[:16] != _MARKER:
         raise BgpParserError("Invalid marker in BGP header")
 
-    length = struct.unpack("!H", payload[16:18])[0]
-    if length != len(payload):
+    length, message_type = _LENGTH_AND_TYPE.unpack_from(data, 16)
+    if length != len(data):
         raise BgpParserError("BGP length mismatch")
 
-    message_type = payload[18]
     if message_type != 2:
         raise BgpParserError(f"Unsupported BGP message type {message_type}")
 
     offset = 19
-    withdrawn_len = struct.unpack("!H", payload[offset : offset + 2])[0]
+    (withdrawn_len,) = _U16.unpack_from(data, offset)
     offset += 2
-    withdrawn_routes, offset = _parse_nlri(payload, offset, withdrawn_len)
+    withdrawn_routes, offset = _parse_nlri(data, offset, withdrawn_len)
 
-    total_path_attr_len = struct.unpack("!H", payload[offset : offset + 2])[0]
+    if len(data) - offset < 2:
+        raise BgpParserError("Truncated path attribute length")
+    (total_path_attr_len,) = _U16.unpack_from(data, offset)
     offset += 2
-    path_attributes, offset = _parse_path_attributes(payload, offset, total_path_attr_len)
+    path_attributes, offset = _parse_path_attributes(data, offset, total_path_attr_len)
 
-    nlri, offset = _parse_nlri(payload, offset, len(payload) - offset)
-    if offset != len(payload):
+    nlri, offset = _parse_nlri(data, offset, len(data) - offset)
+    if offset != len(data):
         raise BgpParserError("Trailing bytes after NLRI parsing")
 
     return BgpUpdate(withdrawn_routes=withdrawn_routes, path_attributes=path_attributes, nlri=nlri)
 
 
-def _parse_nlri(data: bytes, offset: int, length: int) -> tuple[List[str], int]:
+def _parse_nlri(data: memoryview, offset: int, length: int) -> tuple[List[str], int]:
     end = offset + length
-    prefixes: List[str] = []
+    prefix_lengths: List[int] = []
+    # Prefixes are copied into zero-filled four byte slots first so the whole
+    # batch can be formatted with inet_ntoa without padding each one.
+    packed = bytearray()
     while offset < end:
         prefix_length = data[offset]
         offset += 1
+        if prefix_length > 32:
+            raise BgpParserError(f"Invalid IPv4 prefix length {prefix_length}")
         byte_length = (prefix_length + 7) // 8
+        slot = len(packed)
+        packed += _EMPTY_ADDRESS
         prefix_bytes = data[offset : offset + byte_length]
+        packed[slot : slot + len(prefix_bytes)] = prefix_bytes
         offset += byte_length
-        # Pad to four bytes for IPv4 representation.
-        padded = prefix_bytes.ljust(4, b"\x00")
-        prefix = ipaddress.IPv4Address(padded)
-        prefixes.append(f"{prefix}/{prefix_length}")
+        prefix_lengths.append(prefix_length)
+    slots = memoryview(packed)
+    prefixes = [
+        f"{inet_ntoa(slots[index * 4 : index * 4 + 4])}/{prefix_length}"
+        for index, prefix_length in enumerate(prefix_lengths)
+    ]
     return prefixes, offset
 
 
-def _parse_path_attributes(data: bytes, offset: int, length: int) -> tuple[List[BgpPathAttribute], int]:
+def _parse_path_attributes(data: memoryview, offset: int, length: int) -> tuple[List[BgpPathAttribute], int]:
     end = offset + length
     attributes: List[BgpPathAttribute] = []
     while offset < end:
@@ -125,7 +153,7 @@ def _parse_path_attributes(data: bytes, offset: int, length: int) -> tuple[List[
         if flags & 0x10:  # extended length
             if end - offset < 2:
                 raise BgpParserError("Truncated extended length")
-            attr_len = struct.unpack("!H", data[offset : offset + 2])[0]
+            (attr_len,) = _U16.unpack_from(data, offset)
             offset += 2
         else:
             attr_len = data[offset]
@@ -135,18 +163,21 @@ def _parse_path_attributes(data: bytes, offset: int, length: int) -> tuple[List[
         raw_value = data[offset : offset + attr_len]
         offset += attr_len
         value = _decode_attribute_value(type_code, raw_value)
-        attributes.append(BgpPathAttribute(flags=flags, type_code=type_code, value=value, raw_value=raw_value))
+        attributes.append(
+            BgpPathAttribute(flags=flags, type_code=type_code, value=value, raw_value=raw_value.tobytes())
+        )
     if offset != end:
         raise BgpParserError("Path attribute length mismatch")
     return attributes, offset
 
 
-def _decode_attribute_value(type_code: int, raw_value: bytes) -> object:
+def _decode_attribute_value(type_code: int, raw_value: memoryview) -> object:
     if type_code == 1:  # ORIGIN
-        mapping = {0: "IGP", 1: "EGP", 2: "INCOMPLETE"}
-        return mapping.get(raw_value[0], "UNKNOWN") if raw_value else "UNKNOWN"
+        return _ORIGIN_NAMES.get(raw_value[0], "UNKNOWN") if raw_value else "UNKNOWN"
     if type_code == 2:  # AS_PATH
-        values: List[int] = []
+        # ASNs are collected as unsigned 16-bit values straight from the wire
+        # and converted to host byte order once at the end.
+        values = array("H")
         offset = 0
         while offset < len(raw_value):
             if len(raw_value) - offset < 2:
@@ -156,18 +187,20 @@ def _decode_attribute_value(type_code: int, raw_value: bytes) -> object:
             offset += 2
             if segment_type not in {1, 2}:
                 raise BgpParserError(f"Unsupported AS_PATH segment type {segment_type}")
-            for _ in range(segment_length):
-                if len(raw_value) - offset < 2:
-                    raise BgpParserError("Malformed AS_PATH value")
-                values.append(struct.unpack("!H", raw_value[offset : offset + 2])[0])
-                offset += 2
+            segment_end = offset + 2 * segment_length
+            if segment_end > len(raw_value):
+                raise BgpParserError("Malformed AS_PATH value")
+            values.frombytes(raw_value[offset:segment_end])
+            offset = segment_end
+        if _LITTLE_ENDIAN:
+            values.byteswap()
         return values
     if type_code == 3:  # NEXT_HOP
         if len(raw_value) != 4:
             raise BgpParserError("NEXT_HOP attribute must be 4 bytes")
-        return str(ipaddress.IPv4Address(raw_value))
+        return inet_ntoa(raw_value)
     if type_code == 4:  # MULTI_EXIT_DISC
         if len(raw_value) != 4:
             raise BgpParserError("MED attribute must be 4 bytes")
-        return struct.unpack("!I", raw_value)[0]
-    return raw_value
+        return _U32.unpack_from(raw_value)[0]
+    return raw_value.tobytes()
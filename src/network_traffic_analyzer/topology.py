@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import heapq
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from .packets import Packet
+from .paths import dial, dial_width, dijkstra
 from .protocols.bgp import BgpUpdate, parse_bgp_update
 from .protocols.ospf import OspfRouterLsa, parse_ospf_lsas
 
 Link = Tuple[str, str]
 
+_PARSE_CACHE_SIZE = 4096
+
 
 @dataclass
 class LinkMetadata:
@@ -21,18 +26,105 @@ class LinkMetadata:
 
 
 class NetworkTopology:
-    """Incrementally build a topology graph from captured packets."""
-
-    def __init__(self) -> None:
+    """Incrementally build a topology graph from captured packets.
+
+    Captures repeat the same routing messages (periodic LSAs, re-announced
+    prefixes), so decoded payloads are memoised in LRU caches owned by the
+    instance and released with it or by :meth:`clear_parse_cache`.  Cached
+    results are shared between packets and must not be mutated; pass
+    ``cache_parses=False`` to decode every payload afresh.
+
+    ``links`` is a read-only view: links change only through :meth:`add_link`,
+    :meth:`remove_link` and :meth:`merge`, which also invalidate the adjacency
+    snapshot used by path queries.  Do not edit the :class:`LinkMetadata`
+    values in place; remove the link and add it again instead.
+    """
+
+    def __init__(self, *, cache_parses: bool = True) -> None:
+        self.cache_parses = cache_parses
         self.nodes: Set[str] = set()
-        self.links: Dict[Link, LinkMetadata] = defaultdict(LinkMetadata)
+        self._links: Dict[Link, LinkMetadata] = {}
         self.prefix_origins: Dict[str, str] = {}
+        # Compressed sparse row view of ``_links`` used for path queries.  The
+        # outgoing edges of node ``i`` are ``_neighbors[_offsets[i]:_offsets[i + 1]]``
+        # with matching ``_weights``; it is rebuilt lazily after mutations.
+        # ``_dial_width`` is set when the weights allow the bucket-queue kernel.
+        self._adj_dirty = True
+        self._node_ids: Dict[str, int] = {}
+        self._node_names: List[str] = []
+        self._offsets = array("l")
+        self._neighbors = array("l")
+        self._weights = array("d")
+        self._dial_width: Optional[int] = None
+        self._init_parse_caches()
+
+    def _init_parse_caches(self) -> None:
+        self._parse_bgp_update = lru_cache(maxsize=_PARSE_CACHE_SIZE)(parse_bgp_update)
+        self._parse_ospf_lsas = lru_cache(maxsize=_PARSE_CACHE_SIZE)(parse_ospf_lsas)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The caches cannot be pickled and are not worth shipping between processes.
+        state = self.__dict__.copy()
+        del state["_parse_bgp_update"], state["_parse_ospf_lsas"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_parse_caches()
+
+    def clear_parse_cache(self) -> None:
+        """Drop every memoised BGP/OSPF parse result."""
+
+        self._parse_bgp_update.cache_clear()
+        self._parse_ospf_lsas.cache_clear()
+
+    def parse_cache_info(self) -> Dict[str, int]:
+        """Return the combined ``hits``, ``misses`` and ``entries`` of the parse caches."""
+
+        infos = (self._parse_bgp_update.cache_info(), self._parse_ospf_lsas.cache_info())
+        return {
+            "hits": sum(info.hits for info in infos),
+            "misses": sum(info.misses for info in infos),
+            "entries": sum(info.currsize for info in infos),
+        }
+
+    @property
+    def links(self) -> Mapping[Link, LinkMetadata]:
+        return MappingProxyType(self._links)
 
     def add_link(self, src: str, dst: str, *, metric: float, protocol: str) -> None:
-        self.nodes.update({src, dst})
-        metadata = self.links[(src, dst)]
+        metadata = self._link_metadata(src, dst)
         metadata.metric = min(metadata.metric, metric) if metadata.protocols else metric
         metadata.protocols.add(protocol)
+        self._adj_dirty = True
+
+    def remove_link(self, src: str, dst: str) -> None:
+        """Forget the link from ``src`` to ``dst``; its endpoints stay in ``nodes``."""
+
+        del self._links[(src, dst)]
+        self._adj_dirty = True
+
+    def merge(self, other: "NetworkTopology") -> None:
+        """Fold a topology built from a later part of the same capture into this one."""
+
+        self.nodes.update(other.nodes)
+        for (src, dst), other_metadata in other._links.items():
+            metadata = self._link_metadata(src, dst)
+            metadata.metric = (
+                min(metadata.metric, other_metadata.metric) if metadata.protocols else other_metadata.metric
+            )
+            metadata.protocols.update(other_metadata.protocols)
+        self.prefix_origins.update(other.prefix_origins)
+        self._adj_dirty = True
+
+    def _link_metadata(self, src: str, dst: str) -> LinkMetadata:
+        key = (src, dst)
+        metadata = self._links.get(key)
+        if metadata is None:
+            metadata = self._links[key] = LinkMetadata()
+            self.nodes.add(src)
+            self.nodes.add(dst)
+        return metadata
 
     def add_prefix_origin(self, prefix: str, next_hop: Optional[str]) -> None:
         if next_hop is not None:
@@ -53,11 +145,13 @@ class NetworkTopology:
             self.add_link(lsa.advertising_router, neighbor, metric=float(cost), protocol="OSPF")
 
     def ingest_packet(self, packet: Packet) -> None:
+        # Only immutable payloads can be used as cache keys.
+        cached = self.cache_parses and isinstance(packet.payload, bytes)
         if packet.payload_protocol == "BGP":
-            update = parse_bgp_update(packet.payload)
+            update = (self._parse_bgp_update if cached else parse_bgp_update)(packet.payload)
             self.apply_bgp_update(packet.src_ip, update)
         elif packet.payload_protocol == "OSPF":
-            for lsa in parse_ospf_lsas(packet.payload):
+            for lsa in (self._parse_ospf_lsas if cached else parse_ospf_lsas)(packet.payload):
                 self.apply_ospf_lsa(lsa)
 
     def ingest(self, packets: Iterable[Packet]) -> None:
@@ -66,30 +160,51 @@ class NetworkTopology:
 
     def adjacency(self) -> Dict[str, Set[str]]:
         neighbours: Dict[str, Set[str]] = defaultdict(set)
-        for (src, dst), metadata in self.links.items():
+        for (src, dst), metadata in self._links.items():
             neighbours[src].add(dst)
         return neighbours
 
     def shortest_path(self, src: str, dst: str) -> Optional[List[str]]:
         if src not in self.nodes or dst not in self.nodes:
             return None
-        queue: list[tuple[float, str, List[str]]] = [(0.0, src, [src])]
-        visited: Dict[str, float] = {src: 0.0}
-        while queue:
-            cost, node, path = heapq.heappop(queue)
-            if node == dst:
-                return path
-            for neighbour, metadata in self._neighbours_with_metadata(node):
-                new_cost = cost + metadata.metric
-                if neighbour not in visited or new_cost < visited[neighbour]:
-                    visited[neighbour] = new_cost
-                    heapq.heappush(queue, (new_cost, neighbour, path + [neighbour]))
-        return None
-
-    def _neighbours_with_metadata(self, node: str) -> Iterable[tuple[str, LinkMetadata]]:
-        for (src, dst), metadata in self.links.items():
-            if src == node:
-                yield dst, metadata
+        if self._adj_dirty:
+            self._rebuild_csr()
+        source = self._node_ids.get(src)
+        target = self._node_ids.get(dst)
+        if source is None or target is None:
+            return [src] if src == dst else None
+
+        if self._dial_width is not None:
+            path = dial(self._offsets, self._neighbors, self._weights, source, target, self._dial_width)
+        else:
+            path = dijkstra(self._offsets, self._neighbors, self._weights, source, target)
+        if path is None:
+            return None
+        return [self._node_names[node] for node in path]
+
+    def _rebuild_csr(self) -> None:
+        endpoints = {node for link in self._links for node in link}
+        self._node_names = sorted(endpoints)
+        self._node_ids = {node: index for index, node in enumerate(self._node_names)}
+
+        degree = [0] * (len(self._node_names) + 1)
+        for src, _dst in self._links:
+            degree[self._node_ids[src] + 1] += 1
+        for index in range(1, len(degree)):
+            degree[index] += degree[index - 1]
+        self._offsets = array("l", degree)
+
+        cursor = degree[:-1]
+        self._neighbors = array("l", [0]) * len(self._links)
+        self._weights = array("d", [0.0]) * len(self._links)
+        for (src, dst), metadata in self._links.items():
+            src_id = self._node_ids[src]
+            slot = cursor[src_id]
+            self._neighbors[slot] = self._node_ids[dst]
+            self._weights[slot] = metadata.metric
+            cursor[src_id] = slot + 1
+        self._dial_width = dial_width(self._weights, len(self._node_names))
+        self._adj_dirty = False
 
     def describe_prefix(self, prefix: str) -> Optional[str]:
         return self.prefix_origins.get(prefix)
@@ -1,71 +1,126 @@
 from __future__ import annotations
 
 import struct
-
-
+from functools import lru_cache
+from socket import inet_aton
+
+import pytest
+
+from network_traffic_analyzer.packets import Packet
+
+# Marker, header, empty withdrawn routes, the fixed path attributes and the
+# NLRI prefix length of an UPDATE message; only the prefix bytes that follow
+# vary in length.
+_BGP_UPDATE = struct.Struct("!16sHBHH" "4B" "5BHH" "3B4s" "3BI" "B")
+_BGP_MARKER = b"\xff" * 16
+_BGP_ATTRIBUTES_LENGTH = _BGP_UPDATE.size - 24
+
+# OSPF header, LS Update count, then a Router-LSA header and body with a
+# single point-to-point link.
+_OSPF_ROUTER_LSA_UPDATE = struct.Struct("!BBH4s4sHH8s" "I" "HBB4s4sIHH" "BBH4s4sBBH")
+_OSPF_ROUTER_LSA_LENGTH = _OSPF_ROUTER_LSA_UPDATE.size - 28
+_NETMASK_24 = b"\xff\xff\xff\x00"
+_ZERO_ADDR = b"\x00\x00\x00\x00"
+
+# Packed forms of the addresses the tests use, computed once at import.
+_IP = {
+    address: inet_aton(address)
+    for address in (
+        "10.0.0.0",
+        "10.1.0.0",
+        "192.0.2.1",
+        "192.0.2.2",
+        "198.51.100.1",
+        "198.51.100.2",
+        "203.0.113.1",
+    )
+}
+
+
+def _packed(address: str) -> bytes:
+    return _IP.get(address) or inet_aton(address)
+
+
+# Builders return immutable bytes, so repeated calls can share one result.
+@lru_cache(maxsize=128)
 def build_bgp_update(prefix: str = "10.0.0.0/24", next_hop: str = "192.0.2.1") -> bytes:
-    import ipaddress
-
-    marker = b"\xff" * 16
-    message_type = 2
-
-    withdrawn_routes = b"\x00\x00"
-
-    origin_attr = bytes([0x40, 1, 1, 0])
-
-    as_path_value = struct.pack("!BBHH", 2, 2, 65001, 65002)
-    as_path_attr = bytes([0x40, 2, len(as_path_value)]) + as_path_value
-
-    next_hop_attr = bytes([0x40, 3, 4]) + ipaddress.IPv4Address(next_hop).packed
-
-    med_attr = bytes([0x80, 4, 4]) + struct.pack("!I", 25)
-
-    path_attributes = origin_attr + as_path_attr + next_hop_attr + med_attr
-    total_path_len = struct.pack("!H", len(path_attributes))
+    prefix_ip, _, length_text = prefix.partition("/")
+    prefix_length = int(length_text)
+    prefix_bytes = _packed(prefix_ip)[: (prefix_length + 7) >> 3]
+
+    header = _BGP_UPDATE.pack(
+        _BGP_MARKER,
+        _BGP_UPDATE.size + len(prefix_bytes),
+        2,  # UPDATE
+        0,  # no withdrawn routes
+        _BGP_ATTRIBUTES_LENGTH,
+        0x40, 1, 1, 0,  # ORIGIN IGP
+        0x40, 2, 6, 2, 2, 65001, 65002,  # AS_PATH AS_SEQUENCE
+        0x40, 3, 4, _packed(next_hop),  # NEXT_HOP
+        0x80, 4, 4, 25,  # MULTI_EXIT_DISC
+        prefix_length,
+    )
+    return header + prefix_bytes
+
+
+@lru_cache(maxsize=128)
+def build_ospf_router_lsa(
+    advertising_router: str = "192.0.2.1",
+    neighbor: str = "192.0.2.2",
+    metric: int = 10,
+) -> bytes:
+    neighbor_id = _packed(neighbor)
+    router_id = _packed(advertising_router)
+    return _OSPF_ROUTER_LSA_UPDATE.pack(
+        2, 4, _OSPF_ROUTER_LSA_UPDATE.size, router_id, _ZERO_ADDR, 0, 0, bytes(8),
+        1,  # one LSA
+        1, 0, 1, neighbor_id, router_id, 0x80000001, 0, _OSPF_ROUTER_LSA_LENGTH,
+        0, 0, 1, neighbor_id, _NETMASK_24, 1, 0, metric,
+    )
 
-    prefix_ip, prefix_length = prefix.split("/")
-    prefix_length = int(prefix_length)
-    prefix_bytes = ipaddress.IPv4Address(prefix_ip).packed[: (prefix_length + 7) // 8]
-    nlri = bytes([prefix_length]) + prefix_bytes
 
-    length = 19 + len(withdrawn_routes) + 2 + len(path_attributes) + len(nlri)
-    header = marker + struct.pack("!HB", length, message_type)
+def build_bgp_update_view(prefix: str = "10.0.0.0/24", next_hop: str = "192.0.2.1") -> memoryview:
+    """Read-only, zero-copy view of the cached :func:`build_bgp_update` payload."""
 
-    return header + withdrawn_routes + total_path_len + path_attributes + nlri
+    return memoryview(build_bgp_update(prefix, next_hop))
 
 
-def build_ospf_router_lsa(
+def build_ospf_router_lsa_view(
     advertising_router: str = "192.0.2.1",
     neighbor: str = "192.0.2.2",
     metric: int = 10,
-) -> bytes:
-    import ipaddress
-
-    version = 2
-    packet_type = 4
-
-    lsa_body = bytes([0, 0]) + struct.pack("!H", 1)
-    lsa_body += ipaddress.IPv4Address(neighbor).packed
-    lsa_body += ipaddress.IPv4Address("255.255.255.0").packed
-    lsa_body += bytes([1, 0])
-    lsa_body += struct.pack("!H", metric)
-
-    lsa_length = 20 + len(lsa_body)
-    lsa_header = struct.pack("!HBB", 1, 0, 1)
-    lsa_header += ipaddress.IPv4Address(neighbor).packed
-    lsa_header += ipaddress.IPv4Address(advertising_router).packed
-    lsa_header += struct.pack("!I", 0x80000001)
-    lsa_header += struct.pack("!H", 0)
-    lsa_header += struct.pack("!H", lsa_length)
-
-    ls_update_body = struct.pack("!I", 1) + lsa_header + lsa_body
-
-    packet_length = 24 + len(ls_update_body)
-    ospf_header = struct.pack("!BBH", version, packet_type, packet_length)
-    ospf_header += ipaddress.IPv4Address(advertising_router).packed
-    ospf_header += ipaddress.IPv4Address("0.0.0.0").packed
-    ospf_header += struct.pack("!H", 0)
-    ospf_header += struct.pack("!H", 0)
-    ospf_header += b"\x00" * 8
-
-    return ospf_header + ls_update_body
+) -> memoryview:
+    """Read-only, zero-copy view of the cached :func:`build_ospf_router_lsa` payload."""
+
+    return memoryview(build_ospf_router_lsa(advertising_router, neighbor, metric))
+
+
+@pytest.fixture(scope="session")
+def sample_packets() -> tuple[Packet, ...]:
+    """A BGP UPDATE and an OSPF Router-LSA packet shared by the whole session."""
+
+    bgp_packet = Packet(
+        timestamp=1.0,
+        src_ip="203.0.113.1",
+        dst_ip="198.51.100.1",
+        transport_protocol="TCP",
+        payload_protocol="BGP",
+        length=128,
+        payload=build_bgp_update(prefix="10.1.0.0/24", next_hop="198.51.100.1"),
+        latency_ms=95.0,
+        throughput_mbps=80.0,
+    )
+    ospf_packet = Packet(
+        timestamp=1.5,
+        src_ip="198.51.100.1",
+        dst_ip="224.0.0.5",
+        transport_protocol="IP",
+        payload_protocol="OSPF",
+        length=96,
+        payload=build_ospf_router_lsa(
+            advertising_router="198.51.100.1", neighbor="198.51.100.2", metric=5
+        ),
+        latency_ms=20.0,
+        throughput_mbps=120.0,
+    )
+    return (bgp_packet, ospf_packet)
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-from network_traffic_analyzer.protocols.bgp import BgpParserError, parse_bgp_update
-from .conftest import build_bgp_update
+import pytest
+
+from network_traffic_analyzer.protocols.bgp import (
+    BgpParserError,
+    BgpPathAttribute,
+    BgpUpdate,
+    parse_bgp_update,
+)
+from .conftest import build_bgp_update, build_bgp_update_view
+
+_EXPECTED_AS_PATH = (65001, 65002)
+_EXPECTED_NLRI = ("10.0.0.0/24",)
 
 
 def test_parse_bgp_update() -> None:
-    payload = build_bgp_update()
+    payload = build_bgp_update_view()
     update = parse_bgp_update(payload)
     assert update.next_hop == "192.0.2.1"
-    assert update.as_path == [65001, 65002]
-    assert update.nlri == ["10.0.0.0/24"]
+    assert tuple(update.as_path) == _EXPECTED_AS_PATH
+    assert tuple(update.nlri) == _EXPECTED_NLRI
+
+
+def test_as_path_accepts_list_values() -> None:
+    attribute = BgpPathAttribute(flags=0x40, type_code=2, value=[65001, 65002], raw_value=b"")
+    update = BgpUpdate(withdrawn_routes=[], path_attributes=[attribute], nlri=[])
+    assert tuple(update.as_path) == _EXPECTED_AS_PATH
 
 
 def test_invalid_marker_raises() -> None:
-    payload = bytearray(build_bgp_update())
-    payload[0] = 0x00
-    try:
-        parse_bgp_update(bytes(payload))
-    except BgpParserError as exc:
-        assert "marker" in str(exc)
-    else:  # pragma: no cover - defensive
-        raise AssertionError("Expected BgpParserError")
+    payload = build_bgp_update()
+    corrupted = b"\x00" + payload[1:]
+    with pytest.raises(BgpParserError, match="marker"):
+        parse_bgp_update(corrupted)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import gc
+import json
+import threading
+import warnings
+
+import pytest
+
+from network_traffic_analyzer.capture import JSONPacketSource, SimulatorPacketSource
+from .conftest import build_bgp_update
+
+
+def test_json_source_splits_records_across_chunks(tmp_path) -> None:
+    payload = build_bgp_update()
+    records = [
+        {
+            "timestamp": float(index),
+            "src_ip": "203.0.113.1",
+            "dst_ip": "198.51.100.1",
+            "transport_protocol": "TCP",
+            "payload_protocol": "BGP",
+            "length": len(payload),
+            "payload_hex": payload.hex(),
+            "latency_ms": 10.0 + index,
+        }
+        for index in range(3)
+    ]
+    records[1]["meta_router"] = "edge-1"
+    capture = tmp_path / "capture.json"
+    # Blank lines are skipped and the final record has no trailing newline.
+    capture.write_text("\n\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    packets = list(JSONPacketSource(capture, chunk_size=16))
+
+    assert [packet.timestamp for packet in packets] == [0.0, 1.0, 2.0]
+    assert [packet.latency_ms for packet in packets] == [10.0, 11.0, 12.0]
+    assert all(packet.payload == payload for packet in packets)
+    assert [packet.metadata for packet in packets] == [None, {"meta_router": "edge-1"}, None]
+
+
+def test_json_source_skips_payloads_it_does_not_analyze(tmp_path) -> None:
+    record = {
+        "timestamp": 0.0,
+        "src_ip": "203.0.113.1",
+        "dst_ip": "198.51.100.1",
+        "payload_protocol": "HTTP",
+        "length": 2,
+        "payload_hex": "abcd",
+    }
+    capture = tmp_path / "capture.json"
+    capture.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+    (lazy,) = JSONPacketSource(capture)
+    (eager,) = JSONPacketSource(capture, decode_payload=True)
+
+    assert (lazy.payload, lazy.length) == (b"", 2)
+    assert (eager.payload, eager.length) == (b"\xab\xcd", 2)
+
+    # Without an explicit length it is derived from the undecoded hex.
+    del record["length"]
+    record["payload_hex"] = "abcdef"
+    capture.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+    (lazy,) = JSONPacketSource(capture)
+    (eager,) = JSONPacketSource(capture, decode_payload=True)
+
+    assert (lazy.payload, lazy.length) == (b"", 3)
+    assert (eager.payload, eager.length) == (b"\xab\xcd\xef", 3)
+
+
+def test_json_source_keeps_explicit_transport_protocol(tmp_path) -> None:
+    base = {"timestamp": 0.0, "src_ip": "203.0.113.1", "dst_ip": "198.51.100.1"}
+    records = [
+        {**base, "transport_protocol": "", "protocol": "UDP"},
+        {**base, "transport_protocol": None},
+        {**base, "protocol": "UDP"},
+        base,
+    ]
+    capture = tmp_path / "capture.json"
+    capture.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+
+    protocols = [packet.transport_protocol for packet in JSONPacketSource(capture)]
+
+    assert protocols == ["", None, "UDP", "TCP"]
+
+
+_SIMULATOR_RECORD = '{"timestamp": 0.5, "src_ip": "10.0.0.1", "dst_ip": "10.0.0.2", "latency_ms": 4.0}'
+
+
+def _simulator(tmp_path, body: str):
+    script = tmp_path / "simulator.sh"
+    script.write_text(f"#!/bin/sh\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+    return script
+
+
+def test_simulator_source_reads_all_output(tmp_path) -> None:
+    script = _simulator(tmp_path, f"for i in 1 2 3; do echo '{_SIMULATOR_RECORD}'; done")
+
+    packets = list(SimulatorPacketSource(script))
+
+    assert [packet.latency_ms for packet in packets] == [4.0, 4.0, 4.0]
+
+
+def test_simulator_source_reports_failures(tmp_path) -> None:
+    script = _simulator(tmp_path, f"echo '{_SIMULATOR_RECORD}'\necho boom >&2\nexit 3")
+
+    with pytest.raises(RuntimeError, match="exited with 3: boom"):
+        list(SimulatorPacketSource(script))
+
+
+def test_simulator_source_stops_early(tmp_path) -> None:
+    script = _simulator(tmp_path, f"while :; do echo '{_SIMULATOR_RECORD}'; done")
+    threads = threading.active_count()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for index, _packet in enumerate(SimulatorPacketSource(script)):
+            if index == 5:
+                break
+        gc.collect()
+
+    assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
+    assert threading.active_count() == threads
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+
+from network_traffic_analyzer.metrics import TrafficMetrics
+from network_traffic_analyzer.packets import Packet
+
+
+def _packet(src: str, dst: str, timestamp: float, latency: float | None, throughput: float | None) -> Packet:
+    return Packet(
+        timestamp=timestamp,
+        src_ip=src,
+        dst_ip=dst,
+        transport_protocol="TCP",
+        payload_protocol=None,
+        length=0,
+        payload=b"",
+        latency_ms=latency,
+        throughput_mbps=throughput,
+    )
+
+
+def test_averages_per_link() -> None:
+    metrics = TrafficMetrics(keep_samples=True)
+    metrics.extend(
+        [
+            _packet("10.0.0.1", "10.0.0.2", 0.0, 10.0, 100.0),
+            _packet("10.0.0.2", "10.0.0.3", 0.1, None, 50.0),
+            _packet("10.0.0.1", "10.0.0.2", 0.2, 30.0, None),
+        ]
+    )
+
+    assert metrics.average_latency() == {("10.0.0.1", "10.0.0.2"): 20.0}
+    assert metrics.average_throughput() == {
+        ("10.0.0.1", "10.0.0.2"): 100.0,
+        ("10.0.0.2", "10.0.0.3"): 50.0,
+    }
+    assert metrics.latency_samples == {("10.0.0.1", "10.0.0.2"): [10.0, 30.0]}
+
+
+def test_merge_combines_running_totals() -> None:
+    first = TrafficMetrics()
+    first.record_packet(_packet("10.0.0.1", "10.0.0.2", 0.0, 10.0, None))
+    second = TrafficMetrics()
+    second.record_packet(_packet("10.0.0.3", "10.0.0.4", 0.1, 5.0, None))
+    second.record_packet(_packet("10.0.0.1", "10.0.0.2", 0.2, 40.0, None))
+
+    first.merge(second)
+
+    assert first.average_latency() == {("10.0.0.1", "10.0.0.2"): 25.0, ("10.0.0.3", "10.0.0.4"): 5.0}
+    with pytest.raises(ValueError):
+        first.latency_samples
+
+
+def test_rolling_throughput_reports_every_window() -> None:
+    link = ("10.0.0.1", "10.0.0.2")
+    packets = [
+        _packet(*link, 0.0, None, 100.0),
+        _packet(*link, 0.5, None, 200.0),
+        _packet(*link, 2.0, None, 50.0),
+    ]
+
+    rolling = TrafficMetrics().rolling_throughput(packets, window=1.0)
+
+    assert rolling == {0.0: {link: 100.0}, 0.5: {link: 150.0}, 2.0: {link: 50.0}}
+
+
+def test_detect_bottlenecks_checks_both_thresholds() -> None:
+    metrics = TrafficMetrics()
+    metrics.extend(
+        [
+            _packet("10.0.0.1", "10.0.0.2", 0.0, 120.0, None),
+            _packet("10.0.0.2", "10.0.0.3", 0.1, 10.0, 500.0),
+            _packet("10.0.0.3", "10.0.0.4", 0.2, None, 20.0),
+        ]
+    )
+
+    assert metrics.detect_bottlenecks() == [
+        {"link": ("10.0.0.1", "10.0.0.2"), "latency_ms": 120.0, "throughput_mbps": None},
+        {"link": ("10.0.0.3", "10.0.0.4"), "latency_ms": None, "throughput_mbps": 20.0},
+    ]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from __future__ import annotations
 
+import pytest
+
 from network_traffic_analyzer.protocols.ospf import OspfParserError, parse_ospf_lsas
-from .conftest import build_ospf_router_lsa
+from .conftest import build_ospf_router_lsa, build_ospf_router_lsa_view
 
 
 def test_parse_router_lsa() -> None:
-    payload = build_ospf_router_lsa()
+    payload = build_ospf_router_lsa_view()
     lsas = parse_ospf_lsas(payload)
     assert len(lsas) == 1
     lsa = lsas[0]
@@ -16,11 +18,7 @@ def test_parse_router_lsa() -> None:
 
 
 def test_ospf_wrong_type() -> None:
-    payload = bytearray(build_ospf_router_lsa())
-    payload[1] = 1  # invalid packet type
-    try:
-        parse_ospf_lsas(bytes(payload))
-    except OspfParserError as exc:
-        assert "packet type" in str(exc)
-    else:  # pragma: no cover - defensive
-        raise AssertionError("Expected OspfParserError")
+    payload = build_ospf_router_lsa()
+    corrupted = payload[:1] + b"\x01" + payload[2:]  # invalid packet type
+    with pytest.raises(OspfParserError, match="packet type"):
+        parse_ospf_lsas(corrupted)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from network_traffic_analyzer.capture import JSONPacketSource
+from network_traffic_analyzer.metrics import TrafficMetrics
+from network_traffic_analyzer.parallel import analyze_capture
+from network_traffic_analyzer.topology import NetworkTopology
+
+from .conftest import build_bgp_update, build_ospf_router_lsa
+
+
+def test_parallel_analysis_matches_sequential(tmp_path) -> None:
+    capture = tmp_path / "capture.json"
+    with capture.open("w", encoding="utf-8") as handle:
+        for index in range(40):
+            router = f"198.51.100.{index % 4 + 1}"
+            if index % 2:
+                protocol = "OSPF"
+                payload = build_ospf_router_lsa(advertising_router=router, neighbor="198.51.100.9", metric=index)
+            else:
+                protocol = "BGP"
+                payload = build_bgp_update(prefix=f"10.{index}.0.0/16", next_hop=router)
+            record = {
+                "timestamp": index * 0.1,
+                "src_ip": router,
+                "dst_ip": "203.0.113.1",
+                "payload_protocol": protocol,
+                "payload_hex": payload.hex(),
+                "latency_ms": float(index),
+                "throughput_mbps": 100.0 + index,
+            }
+            handle.write(json.dumps(record) + "\n")
+
+    topology = NetworkTopology()
+    metrics = TrafficMetrics()
+    for packet in JSONPacketSource(capture):
+        topology.ingest_packet(packet)
+        metrics.record_packet(packet)
+
+    parallel_topology, parallel_metrics = analyze_capture(capture, workers=3)
+
+    assert parallel_topology.nodes == topology.nodes
+    assert parallel_topology.links == topology.links
+    assert parallel_topology.prefix_origins == topology.prefix_origins
+    assert parallel_metrics.average_latency() == pytest.approx(metrics.average_latency())
+    assert parallel_metrics.average_throughput() == pytest.approx(metrics.average_throughput())
@@ -1,46 +1,20 @@
 from __future__ import annotations
 
+import json
+
+import pytest
+
+from network_traffic_analyzer.cli import main
 from network_traffic_analyzer.dashboard import DashboardData
 from network_traffic_analyzer.metrics import TrafficMetrics
 from network_traffic_analyzer.packets import Packet
-from network_traffic_analyzer.topology import NetworkTopology
-
-from .conftest import build_bgp_update, build_ospf_router_lsa
-
-
-def _sample_packets() -> list[Packet]:
-    bgp_packet = Packet(
-        timestamp=1.0,
-        src_ip="203.0.113.1",
-        dst_ip="198.51.100.1",
-        transport_protocol="TCP",
-        payload_protocol="BGP",
-        length=128,
-        payload=build_bgp_update(prefix="10.1.0.0/24", next_hop="198.51.100.1"),
-        latency_ms=95.0,
-        throughput_mbps=80.0,
-    )
-    ospf_packet = Packet(
-        timestamp=1.5,
-        src_ip="198.51.100.1",
-        dst_ip="224.0.0.5",
-        transport_protocol="IP",
-        payload_protocol="OSPF",
-        length=96,
-        payload=build_ospf_router_lsa(
-            advertising_router="198.51.100.1", neighbor="198.51.100.2", metric=5
-        ),
-        latency_ms=20.0,
-        throughput_mbps=120.0,
-    )
-    return [bgp_packet, ospf_packet]
-
-
-def test_topology_and_dashboard() -> None:
-    packets = _sample_packets()
+from network_traffic_analyzer.topology import LinkMetadata, NetworkTopology
+
+
+def test_topology_and_dashboard(sample_packets: tuple[Packet, ...]) -> None:
     topology = NetworkTopology()
     metrics = TrafficMetrics()
-    for packet in packets:
+    for packet in sample_packets:
         topology.ingest_packet(packet)
         metrics.record_packet(packet)
 
@@ -54,3 +28,91 @@ def test_topology_and_dashboard() -> None:
     assert summary["average_latency_ms"]["203.0.113.1->198.51.100.1"] == 95.0
     markdown = dashboard.to_markdown()
     assert "Network Traffic Dashboard" in markdown
+
+
+def test_shortest_path_tracks_new_links() -> None:
+    topology = NetworkTopology()
+    topology.add_link("10.0.0.1", "10.0.0.2", metric=10.0, protocol="OSPF")
+    topology.add_link("10.0.0.1", "10.0.0.3", metric=1.0, protocol="OSPF")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.2") == ["10.0.0.1", "10.0.0.2"]
+    assert topology.shortest_path("10.0.0.2", "10.0.0.1") is None
+
+    topology.add_link("10.0.0.3", "10.0.0.2", metric=2.0, protocol="OSPF")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.2") == ["10.0.0.1", "10.0.0.3", "10.0.0.2"]
+
+    topology.remove_link("10.0.0.3", "10.0.0.2")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.2") == ["10.0.0.1", "10.0.0.2"]
+
+    # ``links`` is read-only, so the path snapshot cannot go stale behind its back.
+    with pytest.raises(TypeError):
+        topology.links[("10.0.0.1", "10.0.0.4")] = LinkMetadata()  # type: ignore[index]
+
+
+def test_link_can_be_added_again_after_removal() -> None:
+    topology = NetworkTopology()
+    topology.add_link("10.0.0.1", "10.0.0.2", metric=1.0, protocol="OSPF")
+    topology.remove_link("10.0.0.1", "10.0.0.2")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.2") is None
+
+    topology.add_link("10.0.0.1", "10.0.0.2", metric=2.0, protocol="OSPF")
+
+    assert topology.links == {("10.0.0.1", "10.0.0.2"): LinkMetadata(metric=2.0, protocols={"OSPF"})}
+    assert topology.shortest_path("10.0.0.1", "10.0.0.2") == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_shortest_path_with_fractional_metrics() -> None:
+    # Non-integer metrics fall back from the bucket queue to the heap kernel.
+    topology = NetworkTopology()
+    topology.add_link("10.0.0.1", "10.0.0.2", metric=1.5, protocol="OSPF")
+    topology.add_link("10.0.0.2", "10.0.0.3", metric=1.0, protocol="OSPF")
+    topology.add_link("10.0.0.1", "10.0.0.3", metric=3.0, protocol="OSPF")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.3") == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+    topology.add_link("10.0.0.1", "10.0.0.3", metric=2.0, protocol="OSPF")
+    assert topology.shortest_path("10.0.0.1", "10.0.0.3") == ["10.0.0.1", "10.0.0.3"]
+
+
+@pytest.mark.parametrize("cache_parses", [True, False])
+def test_parse_cache_does_not_change_topology(sample_packets: tuple[Packet, ...], cache_parses: bool) -> None:
+    reference = NetworkTopology(cache_parses=False)
+    reference.ingest(sample_packets)
+
+    # Each payload is ingested twice as bytes, which may hit the cache, and
+    # once as a memoryview, which must always bypass it.
+    packets = [*sample_packets, *sample_packets]
+    packets += [packet.copy_with(payload=memoryview(packet.payload)) for packet in sample_packets]
+    topology = NetworkTopology(cache_parses=cache_parses)
+    topology.ingest(packets)
+
+    assert topology.nodes == reference.nodes
+    assert topology.links == reference.links
+    assert topology.prefix_origins == reference.prefix_origins
+    expected = {"hits": 2, "misses": 2, "entries": 2} if cache_parses else {"hits": 0, "misses": 0, "entries": 0}
+    assert topology.parse_cache_info() == expected
+
+    topology.clear_parse_cache()
+    assert topology.parse_cache_info()["entries"] == 0
+
+
+def test_cli_no_cache_matches_cached_output(
+    sample_packets: tuple[Packet, ...], tmp_path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    capture = tmp_path / "capture.json"
+    with capture.open("w", encoding="utf-8") as handle:
+        for packet in (*sample_packets, *sample_packets):
+            record = {
+                "timestamp": packet.timestamp,
+                "src_ip": packet.src_ip,
+                "dst_ip": packet.dst_ip,
+                "payload_protocol": packet.payload_protocol,
+                "payload_hex": packet.payload.hex(),
+                "latency_ms": packet.latency_ms,
+            }
+            handle.write(json.dumps(record) + "\n")
+
+    assert main(["--input", str(capture)]) == 0
+    cached = capsys.readouterr().out
+    assert main(["--input", str(capture), "--no-cache"]) == 0
+
+    assert capsys.readouterr().out == cached
+    assert "198.51.100.2" in cached